@@ -1,6 +1,7 @@
 """Hardware interactions."""
 from curses import flash
 from nis import match
+import functools
 import os
 import re
 import subprocess
@@ -9,6 +10,7 @@ import subprocess
 
 from flashli import configurations
 
+@functools.lru_cache(maxsize=1)
 def is_protectli_device(debugmode: str) -> bool:
     """Detect if this is a Protectli device.
 
@@ -44,6 +46,7 @@ def has_param(debugmode: str, param_check: str) -> bool:
 
 
 
+@functools.lru_cache(maxsize=1)
 def get_cpu(debugmode: str) -> str:
     """Get the CPU model.
 
@@ -68,6 +71,7 @@ def get_cpu(debugmode: str) -> str:
 
 
 
+@functools.lru_cache(maxsize=1)
 def get_protectli_device(debugmode: str, mac_check: str) -> str:
     """Get the model name of this Protectli device.
 
@@ -100,13 +104,14 @@ def get_protectli_device(debugmode: str, mac_check: str) -> str:
     if '3865U' in cpu or '7100U' in cpu or '7200U' in cpu and get_nicTest(debugmode):
         return "fw6m"
 
-    for device, props in configurations.CONFIGURATIONS.items():
+    for device, props in configurations.get().items():
         if props['cpu'] in cpu:
             return '{0}'.format(device) 
             
     return 'Unknown'
 
 
+@functools.lru_cache(maxsize=1)
 def get_bios_mode(debugmode: str) -> str:
     """Check if currently running in EFI or BIOS mode.
 